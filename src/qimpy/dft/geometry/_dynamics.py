@@ -22,6 +22,7 @@ class Dynamics(TreeNode):
 
     system: dft.System  #: System being optimized currently
     masses: torch.Tensor  #: Mass of each ion in system (Dim: n_ions x 1 for bcast)
+    _inv_masses: torch.Tensor  #: Reciprocal of `masses` (Dim: n_ions x 1)
     stepper: Stepper
     comm: MPI.Comm  #: Communictaor over which forces consistent
     dt: float  #: Time step
@@ -139,6 +140,7 @@ class Dynamics(TreeNode):
     def run(self, system: dft.System) -> None:
         self.system = system
         self.masses = Dynamics.get_masses(system.ions)
+        self._inv_masses = self.masses.reciprocal()
         stepper = Stepper(
             self.system,
             drag_wavefunctions=self.drag_wavefunctions,
@@ -156,23 +158,22 @@ class Dynamics(TreeNode):
         thermostat_method.get_velocity(velocity)
         acceleration = self.get_acceleration()
 
-        # MD loop
+        # MD loop (each stage depends on the previous one, so there is no work to
+        # overlap here; device-level asynchrony is within the electronic solve)
         for i_iter in range(self.i_iter_start, self.n_steps + 1):
             self.report(i_iter, velocity)
             if i_iter == self.n_steps:
                 break
 
             # First half-step velocity update
-            velocity = thermostat_method.step(velocity, acceleration, 0.5 * self.dt)
-            velocity = stepper.constrain(velocity)
+            velocity = self.half_step(velocity, acceleration)
 
             # Position and position-dependent acceleration update
             stepper.step(velocity, self.dt)
             acceleration = self.get_acceleration()
 
             # Second half-step velocity update
-            velocity = thermostat_method.step(velocity, acceleration, 0.5 * self.dt)
-            velocity = stepper.constrain(velocity)
+            velocity = self.half_step(velocity, acceleration)
 
         # Check point at end:
         if system.checkpoint_out:
@@ -181,28 +182,33 @@ class Dynamics(TreeNode):
 
     def thermal_velocities(self, T: float, seed: int) -> torch.Tensor:
         """Thermal velocity distribution at `T`, randomized with `seed`."""
-        generator = torch.Generator(device=rc.device)
-        generator.manual_seed(seed)
-        velocities = (
-            torch.randn(
-                *self.system.ions.positions.shape,
-                generator=generator,
-                device=rc.device,
-            )
-            / self.masses.sqrt()
-        )
-        self.comm.Bcast(BufferView(velocities))
+        shape = self.system.ions.positions.shape
+        if rc.use_cuda:
+            generator = torch.Generator(device=rc.device)
+            generator.manual_seed(seed)
+            velocities = torch.randn(*shape, generator=generator, device=rc.device)
+            self.comm.Bcast(BufferView(velocities))  # device buffer, no host staging
+        else:
+            # Same seed on each process yields identical results (no Bcast needed):
+            rng = np.random.default_rng(seed)
+            velocities = torch.from_numpy(rng.standard_normal(tuple(shape)))
+        velocities.mul_(self.masses.rsqrt())
         velocities = self.stepper.constrain(self.create_gradient(velocities)).ions
         # Normalize to set temperature:
         T_current = self.get_T(self.get_KE(velocities))
-        velocities *= np.sqrt(T / T_current)
+        velocities *= (T_current / T).rsqrt()
         return velocities
 
+    def half_step(self, velocity: Gradient, acceleration: Gradient) -> Gradient:
+        """Constrained velocity after half a time step with `acceleration`."""
+        velocity = self.thermostat.method.step(velocity, acceleration, 0.5 * self.dt)
+        return self.stepper.constrain(velocity)
+
     def get_acceleration(self) -> Gradient:
         """Acceleration due to ionic forces."""
         energy, gradient = self.stepper.compute(require_grad=True)
         assert gradient is not None
-        return self.create_gradient(-gradient.ions / self.masses)
+        return self.create_gradient(-gradient.ions * self._inv_masses)
 
     def report(self, i_iter: int, velocity: Gradient) -> None:
         # Update velocities stored within each component:
@@ -211,11 +217,21 @@ class Dynamics(TreeNode):
         system.lattice.strain_rate = velocity.lattice
         self.thermostat.method.set_velocity(velocity)
 
-        # Update velocity-dependent quantities:
-        self.KE = self.get_KE(velocity.ions)
-        self.T = self.get_T(self.KE)
-        self.stress = self.get_stress(velocity.ions)
-        self.P = Dynamics.get_pressure(self.stress)
+        # Update velocity-dependent quantities (with a single transfer to host):
+        # --- KE and kinetic stress share the same mass-weighted outer product:
+        kinetic_tensor = self.get_kinetic_tensor(velocity.ions)
+        KE = 0.5 * torch.trace(kinetic_tensor)
+        self.stress = self.get_stress(velocity.ions, kinetic_tensor)
+        values = [torch.stack((KE, self.get_T(KE)))]
+        if self.stress is not None:
+            values.append(self.stress.flatten())
+        values_host = torch.cat(values).to(rc.cpu).numpy()
+        self.KE, self.T = values_host[:2].tolist()
+        self.P = (
+            None
+            if (self.stress is None)
+            else Dynamics.get_pressure(values_host[2:].reshape(3, 3))
+        )
 
         # Checkpoint:
         if system.checkpoint_out:
@@ -239,34 +255,43 @@ class Dynamics(TreeNode):
     @staticmethod
     def get_masses(ions: Ions) -> torch.Tensor:
         """Collect the masses of all ions as an n_ions x 1 tensor."""
-        atomic_weights = np.empty(ions.n_ions)
-        for ion_slice, symbol in zip(ions.slices, ions.symbols):
-            atomic_weights[ion_slice] = ATOMIC_WEIGHTS[ATOMIC_NUMBERS[symbol]]
+        atomic_numbers = [ATOMIC_NUMBERS[symbol] for symbol in ions.symbols]
+        weights_per_type = ATOMIC_WEIGHTS[atomic_numbers]
+        atomic_weights = np.repeat(weights_per_type, ions.n_ions_type)
         # Convert to atomic units (in terms of m_e):
-        amu = float(Unit(1.0, "amu"))
-        return torch.tensor(atomic_weights, device=rc.device).unsqueeze(1) * amu
+        masses = atomic_weights * float(Unit(1.0, "amu"))
+        return torch.from_numpy(masses).to(rc.device).unsqueeze(1)
+
+    def get_kinetic_tensor(self, velocity: torch.Tensor) -> torch.Tensor:
+        """Compute sum_a m_a v_a v_a^T from ion `velocity` (trace is twice the KE)."""
+        return (velocity * self.masses).T @ velocity
 
-    def get_stress(self, velocity: torch.Tensor) -> Optional[torch.Tensor]:
-        """Compute total stress tensor including ion `velocity` contributions."""
+    def get_stress(
+        self, velocity: torch.Tensor, kinetic_tensor: Optional[torch.Tensor] = None
+    ) -> Optional[torch.Tensor]:
+        """Compute total stress tensor including ion `velocity` contributions.
+        Optionally, reuse `kinetic_tensor` if already computed for `velocity`."""
         lattice = self.system.lattice
         if not lattice.compute_stress:
             return None
-        kinetic_stress = (-1.0 / lattice.volume) * torch.einsum(
-            "a, ai, aj -> ij", self.masses.squeeze(), velocity, velocity
-        )
-        return kinetic_stress + self.system.lattice.stress.detach()
+        # Fuse scaling of kinetic contributions with addition to potential stress:
+        potential_stress = lattice.stress.detach()
+        alpha = -1.0 / lattice.volume
+        if kinetic_tensor is None:
+            mv = velocity * self.masses
+            return torch.addmm(potential_stress, mv.T, velocity, alpha=alpha)
+        return torch.add(potential_stress, kinetic_tensor, alpha=alpha)
 
     @staticmethod
-    def get_pressure(stress: Optional[torch.Tensor]) -> Optional[float]:
-        if stress is None:
-            return None
-        return (-1.0 / 3) * torch.trace(stress).item()
+    def get_pressure(stress_host: np.ndarray) -> float:
+        """Compute pressure from (total) stress, already transferred to host."""
+        return (-1.0 / 3) * float(stress_host.trace())
 
-    def get_KE(self, velocity: torch.Tensor) -> float:
-        """Compute kinetic energy from ion `velocity`."""
-        return 0.5 * (self.masses * velocity.square()).sum().item()
+    def get_KE(self, velocity: torch.Tensor) -> torch.Tensor:
+        """Compute kinetic energy from ion `velocity`, as a scalar tensor on device."""
+        return 0.5 * (self.masses * velocity.square()).sum()
 
-    def get_T(self, KE: float) -> float:
+    def get_T(self, KE: torch.Tensor) -> torch.Tensor:
         """Compute temperature from kinetic energy `KE`."""
         return KE / (0.5 * self.nDOF)
 
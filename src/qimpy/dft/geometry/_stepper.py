@@ -16,6 +16,7 @@ class Stepper:
     invRbasis0: torch.Tensor  #: Initial lattice vectors inverse (used to define strain)
     drag_wavefunctions: bool  #: Whether to drag atomic components of wavefunctions
     isotropic: bool  #: Whether to force lattice changes to be isotropic (NPT mode)
+    _eye: torch.Tensor  #: 3 x 3 identity on `rc.device`, reused in constraints
     _lowdin: Optional[Lowdin]  #: Lowdin and wavefunction drag shared data
 
     def __init__(
@@ -29,6 +30,7 @@ class Stepper:
         self.drag_wavefunctions = drag_wavefunctions
         self.isotropic = isotropic
         self.invRbasis0 = system.lattice.invRbasis
+        self._eye = torch.eye(3, device=rc.device)
         self._lowdin = None
 
     def step(self, direction: Gradient, step_size: float) -> None:
@@ -55,7 +57,10 @@ class Stepper:
             self._lowdin = None
 
     def compute(self, require_grad: bool) -> tuple[Energy, Optional[Gradient]]:
-        """Compute energy and optionally ionic/lattice gradient."""
+        """Compute energy and optionally ionic/lattice gradient.
+        The gradient is evaluated explicitly by `System.geometry_grad`, rather than
+        by back-propagation through the electronic solve, so no autograd graph of
+        the calculation is retained (autograd is only used locally within XC)."""
         system = self.system
         lattice = system.lattice
         # Update ionic potentials and energies:
@@ -97,8 +102,7 @@ class Stepper:
 
     @property
     def strain(self) -> torch.Tensor:
-        eye = torch.eye(3, device=rc.device)
-        return self.system.lattice.Rbasis @ self.invRbasis0 - eye
+        return self.system.lattice.Rbasis @ self.invRbasis0 - self._eye
 
     def constrain(self, v: Gradient) -> Gradient:
         """Impose fixed atom / lattice direction constraints."""
@@ -106,7 +110,7 @@ class Stepper:
         v.ions -= v.ions.mean(dim=0)
         if self.isotropic and (v.lattice is not None):
             isotropic_strain = torch.trace(v.lattice) / 3.0
-            v.lattice = isotropic_strain * torch.eye(3, device=rc.device)
+            v.lattice = isotropic_strain * self._eye
         self.symmetrize_(v)
         return v
 
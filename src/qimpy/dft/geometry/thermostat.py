@@ -95,7 +95,11 @@ class NVE(TreeNode):
 
     def step(self, velocity: Gradient, acceleration: Gradient, dt: float) -> Gradient:
         """Return velocity after `dt`, given current `velocity` and `acceleration`."""
-        return velocity + acceleration * dt
+        result = Gradient(ions=torch.add(velocity.ions, acceleration.ions, alpha=dt))
+        if velocity.lattice is not None:
+            assert acceleration.lattice is not None
+            result.lattice = torch.add(velocity.lattice, acceleration.lattice, alpha=dt)
+        return result
 
     def initialize_gradient(self, gradient: Gradient) -> None:
         """No optional `gradient` terms for this thermostat method."""
@@ -332,7 +336,7 @@ class Langevin(TreeNode):
         rand = torch.randn_like(velocity.ions)
         self.dynamics.comm.Bcast(BufferView(rand))
         variances = 2 * dynamics.T0 / (dynamics.masses * (dynamics.t_damp_T * dt))
-        acceleration_noise = Gradient(ions=(rand * variances.sqrt()))
+        acceleration_noise = Gradient(ions=rand.mul_(variances.sqrt()))
         # Take step including velocity-dependent damping:
         return second_order_step(
             velocity, acceleration + acceleration_noise, self.extra_acceleration, dt
@@ -358,5 +362,10 @@ def second_order_step(
     Integrate dv/dt = acceleration0 + acceleration(v) over dt to second order.
     Start from v = velocity at time t, and return velocity at t+dt.
     """
-    velocity_half = velocity + (acceleration0 + acceleration(velocity)) * (0.5 * dt)
-    return velocity + (acceleration0 + acceleration(velocity_half)) * dt
+    # Scale the summed accelerations in place to avoid extra temporaries:
+    delta = acceleration0 + acceleration(velocity)
+    delta *= 0.5 * dt
+    velocity_half = velocity + delta
+    delta = acceleration0 + acceleration(velocity_half)
+    delta *= dt
+    return velocity + delta
@@ -1,3 +1,5 @@
+import os
+
 import torch
 import numpy as np
 
@@ -7,8 +9,18 @@ from qimpy.profiler import StopWatch
 from ._advect import Advect
 
 
-def movie(Nxy, N_theta, diag=True):
-    import matplotlib.pyplot as plt
+def gaussian_blob(q: torch.Tensor, Lx: float, Ly: float, sigma: float) -> torch.Tensor:
+    """Gaussian of width `sigma` at the center of the domain, evaluated at `q`."""
+    r_sq = (q[..., 0] - 0.5 * Lx).square()
+    r_sq += (q[..., 1] - 0.5 * Ly).square()
+    return r_sq.mul_(-1.0 / (sigma * sigma)).exp_()
+
+
+def movie(Nxy, N_theta, diag=True, plot_every=0):
+    """Advect a Gaussian blob, saving a frame every `plot_every` steps (0: never).
+    Leave frames off to benchmark the time steps alone."""
+    if plot_every:
+        import matplotlib.pyplot as plt
 
     log_config()
     rc.init()
@@ -28,11 +40,7 @@ def movie(Nxy, N_theta, diag=True):
         N_theta=N_theta,
         init_angle=np.pi / 4 if diag else 0.0,
     )
-    sigma = 0.05
-    sim.rho[:, :, 0] = torch.exp(
-        -((sim.q[:, :, 0] - sim.Lx / 2) ** 2 + (sim.q[:, :, 1] - sim.Ly / 2) ** 2)
-        / sigma**2
-    ).detach()
+    sim.rho[:, :, 0] = gaussian_blob(sim.q.detach(), sim.Lx, sim.Ly, 0.05)
     density_init = torch.clone(sim.density)
 
     t_final = (Lx**2 + Ly**2) ** 0.5 / v_F if diag else Lx / v_F
@@ -41,14 +49,15 @@ def movie(Nxy, N_theta, diag=True):
 
     for time_step in range(time_steps):
         log.info(f"{time_step = }")
-        plt.clf()
-        sim.plot_streamlines(plt, dict(levels=100), dict(linewidth=1.0))
-        plt.gca().set_aspect("equal")
-        plt.savefig(
-            f"advect_animation/blob_advect_{time_step:04d}.png",
-            bbox_inches="tight",
-            dpi=200,
-        )
+        if plot_every and (time_step % plot_every == 0):
+            plt.clf()
+            sim.plot_streamlines(plt, dict(levels=100), dict(linewidth=1.0))
+            plt.gca().set_aspect("equal")
+            plt.savefig(
+                f"advect_animation/blob_advect_{time_step:04d}.png",
+                bbox_inches="tight",
+                dpi=200,
+            )
         sim.time_step()
 
     # Plot only at end (for easier performance benchmarking of time steps):
@@ -80,11 +89,7 @@ def convergence(Nxy, N_theta, diag=True):
         N_theta=N_theta,
         init_angle=np.pi / 4 - np.pi / N_theta if diag else 0.0,
     )
-    sigma = 0.05
-    sim.rho[:, :, 0] = torch.exp(
-        -((sim.q[:, :, 0] - sim.Lx / 2) ** 2 + (sim.q[:, :, 1] - sim.Ly / 2) ** 2)
-        / sigma**2
-    ).detach()
+    sim.rho[:, :, 0] = gaussian_blob(sim.q.detach(), sim.Lx, sim.Ly, 0.05)
     density_init = torch.clone(sim.density)
 
     t_final = (Lx**2 + Ly**2) ** 0.5 / v_F if diag else Lx / v_F
@@ -112,7 +117,7 @@ def convergence(Nxy, N_theta, diag=True):
 
 
 def main():
-    movie(256, 256, diag=True)
+    movie(256, 256, diag=True, plot_every=int(os.environ.get("PLOT_EVERY", "0")))
     # errors = dict()
     # Nthetas = [2, 4, 256]
     # Ns = [64, 128, 256, 512]